@@ -1,18 +1,24 @@
 """Internal cache operations for GerryDB."""
 import gzip
+import os
 import pickle
 import sqlite3
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from os import PathLike
 from pathlib import Path
-from typing import Optional, TypeVar, Union
+from threading import get_ident
+from typing import Generator, Optional, TypeVar, Union
 
 from gerrydb.schemas import BaseModel, ViewMeta
 
 from .exceptions import CacheInitError
 
 _REQUIRED_TABLES = {"cache_meta", "graph", "view"}
-_CACHE_SCHEMA_VERSION = "0"
+_CACHE_SCHEMA_VERSION = "1"
+# Schema versions written by older clients. Caches are disposable, so these
+# are discarded and reinitialized rather than migrated in place.
+_LEGACY_SCHEMA_VERSIONS = {"0"}  # "0": `cached_at` stored as ISO 8601 text
 CACHE_EXTENSIONS = (
     "gpkg",  # view archive
     "pkl.gz",  # graph (derived from view archive)
@@ -21,6 +27,23 @@ CACHE_EXTENSIONS = (
 SchemaType = TypeVar("SchemaType", bound=BaseModel)
 
 
+def _epoch_ms(timestamp: datetime) -> int:
+    """Converts a timestamp to integer milliseconds since the Unix epoch."""
+    return int(timestamp.timestamp() * 1000)
+
+
+def _write_file_atomic(path: Path, content: bytes) -> None:
+    """Writes `content` to `path` without exposing a partially written file."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as tmp_fp:
+            tmp_fp.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class GerryCache:
     """Caching layer for GerryDB."""
 
@@ -28,25 +51,57 @@ class GerryCache:
     data_dir: Path
 
     def __init__(
-        self, database: Union[str, PathLike, sqlite3.Connection], data_dir: Path
+        self,
+        database: Union[str, PathLike, sqlite3.Connection],
+        data_dir: Path,
+        pragmas: Optional[dict[str, str]] = None,
     ):
-        """Loads or initializes a cache."""
+        """Loads or initializes a cache.
+
+        Args:
+            database: Path to the cache database, or an open SQLite connection.
+            data_dir: Directory for cached view files.
+            pragmas: SQLite `PRAGMA` settings to apply to the connection
+                (e.g. `{"synchronous": "OFF"}` for a throwaway cache).
+
+        Raises:
+            CacheInitError: If the cache cannot be loaded or is invalid,
+                or if a pragma name is not a valid identifier.
+        """
+        pragmas = pragmas or {}
+        for pragma in pragmas:
+            # Pragma names cannot be bound as query parameters.
+            if not pragma.isidentifier():
+                raise CacheInitError(f"Invalid SQLite pragma name: {pragma!r}.")
+
         if isinstance(database, sqlite3.Connection):
             self._conn = database
         else:
             try:
-                self._conn = sqlite3.connect(database)
+                # Transactions are managed explicitly (see `_transaction()`).
+                self._conn = sqlite3.connect(database, isolation_level=None)
             except sqlite3.OperationalError as ex:
                 raise CacheInitError(
                     "Failed to load to initialize GerryDB cache ({database})."
                 ) from ex
 
-        if not self._tables():
+        for pragma, value in pragmas.items():
+            self._conn.execute(f"PRAGMA {pragma} = {value}")
+
+        self.data_dir = data_dir
+        tables = self._tables()
+        if not tables:
             self._init_db()
         else:
-            self._assert_clean()
+            schema_version = self._schema_version()
+            if schema_version in _LEGACY_SCHEMA_VERSIONS:
+                self._reset_db(tables)
+            else:
+                self._assert_clean(tables, schema_version)
 
-        self.data_dir = data_dir
+    def close(self) -> None:
+        """Closes the cache database."""
+        self._conn.close()
 
     def upsert_view_gpkg(
         self, namespace: str, path: str, render_id: str, content: bytes
@@ -57,32 +112,39 @@ class GerryCache:
             Path of the cached GeoPackage.
         """
         gpkg_path = self.data_dir / f"{render_id}.gpkg"
-        with open(gpkg_path, "wb") as gpkg_fp:
-            gpkg_fp.write(content)
-
-        with self._conn:
-            # Register the new render.
-            prev_render_id = self._conn.execute(
-                "SELECT render_id FROM view WHERE namespace = ? AND path = ?",
-                (namespace, path),
-            ).fetchone()
-            if prev_render_id is not None:
-                self._conn.execute(
-                    "DELETE FROM view WHERE namespace = ? AND path = ?",
+        prev_render_id = None
+        try:
+            with self._transaction():
+                # Register the new render, replacing the previous render (if any).
+                prev_render_id = self._conn.execute(
+                    "SELECT render_id FROM view WHERE namespace = ? AND path = ?",
                     (namespace, path),
+                ).fetchone()
+                _write_file_atomic(gpkg_path, content)
+                self._conn.execute(
+                    """INSERT INTO view (namespace, path, render_id, cached_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(namespace, path) DO UPDATE SET
+                        render_id = excluded.render_id,
+                        cached_at = excluded.cached_at""",
+                    (
+                        namespace,
+                        path,
+                        render_id,
+                        _epoch_ms(datetime.now(timezone.utc)),
+                    ),
                 )
-                for ext in CACHE_EXTENSIONS:
-                    Path(self.data_dir / f"{prev_render_id[0]}.{ext}").unlink(
-                        missing_ok=True
-                    )
+        except BaseException:
+            # Don't leave an unregistered GeoPackage behind.
+            if prev_render_id is None or prev_render_id[0] != render_id:
+                gpkg_path.unlink(missing_ok=True)
+            raise
 
-            self._conn.execute(
-                (
-                    "INSERT INTO view (namespace, path, render_id, cached_at) "
-                    "VALUES (?, ?, ?, ?)"
-                ),
-                (namespace, path, render_id, datetime.now().isoformat()),
-            )
+        if prev_render_id is not None and prev_render_id[0] != render_id:
+            for ext in CACHE_EXTENSIONS:
+                Path(self.data_dir / f"{prev_render_id[0]}.{ext}").unlink(
+                    missing_ok=True
+                )
 
         return gpkg_path
 
@@ -96,16 +158,50 @@ class GerryCache:
             return None
 
         gpkg_path = self.data_dir / f"{render_id[0]}.gpkg"
-        if not gpkg_path.is_file():
+        try:
+            os.stat(gpkg_path)
+        except FileNotFoundError:
             # TODO: this implies a corrupt cache index.
             # What's the right way to handle that?
             return None
         return gpkg_path
 
-    def _commit(self) -> bool:
-        """Commits the cache transaction."""
+    @contextmanager
+    def _transaction(self) -> Generator[None, None, None]:
+        """Wraps a block of cache operations in a transaction.
+
+        If a transaction is already open (e.g. a batch of operations awaiting
+        an explicit `_commit()`), the block runs in a savepoint within that
+        transaction instead: a failed block is undone, but committing is left
+        to the owner of the outer transaction.
+        """
+        if self._conn.in_transaction:
+            self._conn.execute("SAVEPOINT gerrydb_cache")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK TO gerrydb_cache")
+                raise
+            finally:
+                self._conn.execute("RELEASE gerrydb_cache")
+            return
+
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
         self._conn.execute("COMMIT")
 
+    def _commit(self) -> None:
+        """Commits the cache transaction."""
+        self._conn.commit()
+
+    def _rollback(self) -> None:
+        """Rolls back the cache transaction."""
+        self._conn.rollback()
+
     def _tables(self) -> set[str]:
         """Fetches a list of user-defined tables in the cache database."""
         # see https://www.sqlitetutorial.net/sqlite-show-tables/
@@ -115,55 +211,88 @@ class GerryCache:
         ).fetchall()
         return {table[0] for table in tables}
 
-    def _assert_clean(self) -> None:
+    def _assert_clean(self, tables: set[str], schema_version: Optional[str]) -> None:
         """Asserts that the cache's schema matches the current schema version.
+
+        Args:
+            tables: User-defined tables in the cache database (see `_tables()`).
+            schema_version: The cache's schema version (see `_schema_version()`).
+
         Raises:
             CacheInitError: If the cache is invalid.
         """
-        table_diff = _REQUIRED_TABLES - self._tables()
+        table_diff = _REQUIRED_TABLES - tables
         if table_diff:
             missing_tables = ", ".join(table_diff)
             raise CacheInitError(f"Invalid cache: missing table(s) {missing_tables}.")
 
-        schema_version = self._conn.execute(
-            "SELECT value FROM cache_meta WHERE key='schema_version'"
-        ).fetchone()
         if schema_version is None:
             raise CacheInitError("Invalid cache: no schema version in cache metadata.")
-        if schema_version[0] != _CACHE_SCHEMA_VERSION:
+        if schema_version != _CACHE_SCHEMA_VERSION:
             raise CacheInitError(
                 f"Invalid cache: expected schema version {_CACHE_SCHEMA_VERSION}, "
-                f"but got schema version {schema_version[0]}."
+                f"but got schema version {schema_version}."
+            )
+
+    def _schema_version(self) -> Optional[str]:
+        """Fetches the cache's schema version (`None` if unavailable)."""
+        try:
+            schema_version = self._conn.execute(
+                "SELECT value FROM cache_meta WHERE key='schema_version'"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # No metadata table.
+            return None
+        return None if schema_version is None else schema_version[0]
+
+    def _reset_db(self, tables: set[str]) -> None:
+        """Discards a cache written by an older client and reinitializes it.
+
+        Args:
+            tables: User-defined tables in the cache database (see `_tables()`).
+        """
+        with self._transaction():
+            render_ids = (
+                [row[0] for row in self._conn.execute("SELECT render_id FROM view")]
+                if "view" in tables
+                else []
             )
+            for table in _REQUIRED_TABLES & tables:
+                self._conn.execute(f"DROP TABLE {table}")
+            self._init_db()
+
+        for render_id in render_ids:
+            for ext in CACHE_EXTENSIONS:
+                Path(self.data_dir / f"{render_id}.{ext}").unlink(missing_ok=True)
 
     def _init_db(self) -> None:
         """Initializes GerryDB cache tables."""
-        self._conn.execute(
-            """CREATE TABLE cache_meta(
-                key   TEXT PRIMARY KEY NOT NULL,
-                value TEXT NOT NULL
-            )"""
-        )
-        self._conn.execute(
-            """CREATE TABLE view(
-                namespace        TEXT NOT NULL,
-                path             TEXT NOT NULL,
-                render_id        TEXT NOT NULL,
-                cached_at        TEXT NOT NULL,
-                UNIQUE(namespace, path)
-            )"""
-        )
-        self._conn.execute(
-            """CREATE TABLE graph(
-                render_id   TEXT    NOT NULL REFERENCES view(render_id),
-                plans       INTEGER NOT NULL, 
-                geometry    INTEGER NOT NULL, 
-                cached_at   TEXT    NOT NULL,
-                UNIQUE(render_id, plans, geometry)
-            )"""
-        )
-        self._conn.execute(
-            "INSERT INTO cache_meta (key, value) VALUES ('schema_version', ?)",
-            _CACHE_SCHEMA_VERSION,
-        )
-        self._conn.commit()
+        with self._transaction():
+            self._conn.execute(
+                """CREATE TABLE cache_meta(
+                    key   TEXT PRIMARY KEY NOT NULL,
+                    value TEXT NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                """CREATE TABLE view(
+                    namespace        TEXT NOT NULL,
+                    path             TEXT NOT NULL,
+                    render_id        TEXT NOT NULL,
+                    cached_at        INTEGER NOT NULL,
+                    UNIQUE(namespace, path)
+                )"""
+            )
+            self._conn.execute(
+                """CREATE TABLE graph(
+                    render_id   TEXT    NOT NULL REFERENCES view(render_id),
+                    plans       INTEGER NOT NULL, 
+                    geometry    INTEGER NOT NULL, 
+                    cached_at   INTEGER NOT NULL,
+                    UNIQUE(render_id, plans, geometry)
+                )"""
+            )
+            self._conn.execute(
+                "INSERT INTO cache_meta (key, value) VALUES ('schema_version', ?)",
+                (_CACHE_SCHEMA_VERSION,),
+            )
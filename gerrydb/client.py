@@ -4,9 +4,8 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
-import geopandas as gpd
 import httpx
 import pandas as pd
 import tomlkit
@@ -27,8 +26,10 @@ from gerrydb.repos import (
     ViewRepo,
     ViewTemplateRepo,
 )
+from gerrydb.repos.base import HTTP2
 from gerrydb.repos.geography import GeoValType
 from gerrydb.schemas import (
+    NATIVE_PROJ,
     Column,
     ColumnSet,
     Geography,
@@ -43,6 +44,9 @@ from gerrydb.schemas import (
     ViewTemplate,
 )
 
+if TYPE_CHECKING:
+    import geopandas as gpd
+
 DEFAULT_GERRYDB_ROOT = Path(os.path.expanduser("~")) / ".gerrydb"
 
 
@@ -66,6 +70,9 @@ class GerryDB:
         namespace: Optional[str] = None,
         offline: bool = False,
         timeout: int = 180,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        config: Optional[dict[str, dict[str, Any]]] = None,
     ):
         """Creates a GerryDB session.
 
@@ -73,7 +80,10 @@ class GerryDB:
         with an in-memory cache. Otherwise, session configuration is loaded
         for `profile` from the configuration in the directory specified by
         the `GERRYDB_ROOT` environment variable. If this variable is not
-        available, `~/.gerrydb` is used.
+        available, `~/.gerrydb` is used. If `config` is specified, it is used
+        in place of the configuration file: it maps profile names to profiles
+        with `host` and `key` fields. (Caches are still stored in the
+        configuration directory.)
 
         If `namespace` is specified, object references without a namespace
         will implicitly refer to `namespace`.
@@ -85,6 +95,12 @@ class GerryDB:
         accessible--for instance, within code in a replication repository
         for a scientific paper.
 
+        If `transport` is specified, synchronous API requests are sent through
+        it, so its connection pool can be shared across sessions. Likewise,
+        if `async_transport` is specified, asynchronous API requests (used for
+        bulk operations such as `load_dataframe()`) are sent through it.
+        Otherwise, the session creates its own transports.
+
         Raises:
             ConfigError:
                 If the configuration is invalid--for instance, if only
@@ -107,37 +123,41 @@ class GerryDB:
             self.cache = GerryCache(":memory:", Path(self._temp_dir.name))
         else:
             GERRYDB_ROOT = Path(os.getenv("GERRYDB_ROOT", DEFAULT_GERRYDB_ROOT))
-            try:
-                with open(GERRYDB_ROOT / "config", encoding="utf-8") as config_fp:
-                    config_raw = config_fp.read()
-            except IOError as ex:
-                raise ConfigError(
-                    "Failed to read GerryDB configuration at "
-                    f"{GERRYDB_ROOT.resolve()}. "
-                    "Does a GerryDB configuration directory exist?"
-                ) from ex
-
-            try:
-                configs = tomlkit.parse(config_raw)
-            except tomlkit.exceptions.TOMLKitError as ex:
-                raise ConfigError(
-                    "Failed to parse GerryDB configuration at "
-                    f"{GERRYDB_ROOT.resolve()}."
-                ) from ex
+            if config is None:
+                config_location = f"configuration at {GERRYDB_ROOT.resolve()}"
+                try:
+                    with open(GERRYDB_ROOT / "config", encoding="utf-8") as config_fp:
+                        config_raw = config_fp.read()
+                except IOError as ex:
+                    raise ConfigError(
+                        "Failed to read GerryDB configuration at "
+                        f"{GERRYDB_ROOT.resolve()}. "
+                        "Does a GerryDB configuration directory exist?"
+                    ) from ex
+
+                try:
+                    configs = tomlkit.parse(config_raw)
+                except tomlkit.exceptions.TOMLKitError as ex:
+                    raise ConfigError(
+                        "Failed to parse GerryDB configuration at "
+                        f"{GERRYDB_ROOT.resolve()}."
+                    ) from ex
+            else:
+                config_location = "provided configuration"
+                configs = config
 
             try:
-                config = configs[profile]
+                profile_config = configs[profile]
             except KeyError:
                 raise ConfigError(
-                    f'Profile "{profile}" not found in configuration '
-                    f"at {GERRYDB_ROOT.resolve()}."
+                    f'Profile "{profile}" not found in {config_location}.'
                 )
 
             for field in ("host", "key"):
-                if field not in config:
+                if field not in profile_config:
                     raise ConfigError(
                         f'Field "{field}" not in profile "{profile}" '
-                        f"in configuration at {GERRYDB_ROOT.resolve()}."
+                        f"in {config_location}."
                     )
 
             profile_cache_dir = Path(GERRYDB_ROOT / "caches" / profile)
@@ -152,8 +172,8 @@ class GerryDB:
                 data_dir=profile_cache_dir,
             )
 
-            host = config["host"]
-            key = config["key"]
+            host = profile_config["host"]
+            key = profile_config["key"]
 
         self._base_url = (
             f"http://{host}/api/v1"
@@ -161,7 +181,12 @@ class GerryDB:
             else f"https://{host}/api/v1"
         )
         self._base_headers = {"User-Agent": "gerrydb-client-py", "X-API-Key": key}
-        self._transport = httpx.HTTPTransport(retries=1)
+        self._transport = (
+            httpx.HTTPTransport(retries=1, http2=HTTP2)
+            if transport is None
+            else transport
+        )
+        self._async_transport = async_transport
 
         self.client = httpx.Client(
             base_url=self._base_url,
@@ -170,6 +195,16 @@ class GerryDB:
             transport=self._transport,
         )
 
+    def _async_client_params(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Adapts synchronous client parameters for an asynchronous client."""
+        async_params = params.copy()
+        async_params["transport"] = (
+            httpx.AsyncHTTPTransport(retries=1, http2=HTTP2)
+            if self._async_transport is None
+            else self._async_transport
+        )
+        return async_params
+
     def context(self, notes: str = "") -> "WriteContext":
         """Creates a write context with session-level metadata.
 
@@ -266,7 +301,12 @@ class WriteContext:
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self.client.close()
+        # The context's client is built on the session's shared transport and
+        # owns no other resources (httpx does not mount proxy transports on
+        # clients with an explicit transport). Closing the client would close
+        # the shared transport's connection pool, so the client is dropped
+        # without closing it.
+        pass
 
     @property
     def columns(self) -> ColumnRepo:
@@ -328,7 +368,7 @@ class WriteContext:
 
     def load_dataframe(
         self,
-        df: Union[pd.DataFrame, gpd.GeoDataFrame],
+        df: Union[pd.DataFrame, "gpd.GeoDataFrame"],
         columns: dict[str, Column],
         *,
         create_geo: bool = False,
@@ -378,8 +418,11 @@ class WriteContext:
 
         if create_geo:
             if "geometry" in df.columns:
-                df = df.to_crs("epsg:4269")  # import as lat/long
-                geos = dict(df.geometry)
+                geometry = df.geometry
+                if geometry.crs is None or not NATIVE_PROJ.equals(geometry.crs):
+                    # Import as lat/long; only the geometry column is reprojected.
+                    geometry = geometry.to_crs(NATIVE_PROJ)
+                geos = dict(geometry)
             else:
                 geos = {key: None for key in df.index}
 
@@ -447,14 +490,17 @@ async def _load_column_values(
     max_conns: Optional[int],
 ) -> None:
     """Asynchronously loads column values from a DataFrame in batches."""
-    params = repo.ctx.client_params.copy()
-    params["transport"] = httpx.AsyncHTTPTransport(retries=1)
+    params = repo.session._async_client_params(repo.ctx.client_params)
 
+    # `tolist()` converts NumPy scalars to native Python values in bulk, so
+    # batches are JSON-serializable without per-value coercion.
+    paths = df.index.tolist()
     val_batches: list[tuple[Column, dict[str, Any]]] = []
     for col_name, col_meta in columns.items():
-        col_vals = list(dict(df[col_name]).items())
+        col_vals = df[col_name].tolist()
         for idx in range(0, len(df), batch_size):
-            val_batches.append((col_meta, dict(col_vals[idx : idx + batch_size])))
+            batch = zip(paths[idx : idx + batch_size], col_vals[idx : idx + batch_size])
+            val_batches.append((col_meta, dict(batch)))
 
     async with httpx.AsyncClient(**params) as client:
         tasks = [
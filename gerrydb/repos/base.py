@@ -1,7 +1,9 @@
 """Base objects and utilities for GerryDB API object repositories."""
+import asyncio
+import importlib.util
 from dataclasses import dataclass
 from functools import wraps
-from typing import TYPE_CHECKING, Callable, Generic, Optional, Tuple, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, Tuple, TypeVar
 
 import httpx
 import pydantic
@@ -17,6 +19,10 @@ SchemaType = TypeVar("SchemaType", bound=BaseModel)
 
 NAMESPACE_ERR = "No namespace specified for all() query, and no default available."
 
+# HTTP/2 multiplexes concurrent requests over a single connection; it is
+# negotiated with the server when the optional `h2` package is installed.
+HTTP2 = importlib.util.find_spec("h2") is not None
+
 
 def err(message: str) -> Callable:
     """Decorator for handling HTTP request and Pydantic validation errors."""
@@ -120,6 +126,44 @@ def parse_path(path: str) -> Tuple[str, str]:
         )
 
 
+def check_required_fields(
+    specs: list[dict[str, Any]], fields: list[str], kind: str
+) -> None:
+    """Checks that bulk creation specs contain all required fields.
+
+    Raises:
+        RequestError: If a spec is missing a required field.
+    """
+    for idx, spec in enumerate(specs):
+        missing = [field for field in fields if field not in spec]
+        if missing:
+            raise RequestError(
+                f"Invalid {kind} at index {idx} "
+                f"(path: {spec.get('path', 'not specified')}): "
+                f"missing required field(s) {', '.join(missing)}."
+            )
+
+
+def check_unknown_fields(
+    specs: list[dict[str, Any]], fields: list[str], kind: str
+) -> None:
+    """Checks that bulk creation specs contain only known fields.
+
+    Unknown fields (typically typos) would otherwise be silently dropped.
+
+    Raises:
+        RequestError: If a spec contains a field not in `fields`.
+    """
+    for idx, spec in enumerate(specs):
+        unknown = [field for field in spec if field not in fields]
+        if unknown:
+            raise RequestError(
+                f"Invalid {kind} at index {idx} "
+                f"(path: {spec.get('path', 'not specified')}): "
+                f"unknown field(s) {', '.join(unknown)}."
+            )
+
+
 class ObjectRepo:
     """Base class for object repositories."""
 
@@ -159,6 +203,29 @@ class NamespacedObjectRepo(Generic[SchemaType]):
         response.raise_for_status()
         return self.schema(**response.json())
 
+    async def _async_create_many(
+        self, payloads: list[dict[str, Any]], namespace: str, max_conns: int
+    ) -> list[SchemaType]:
+        """Asynchronously creates objects from serialized creation requests.
+
+        Requests are sent concurrently (at most `max_conns` at a time) within
+        the repository's write context; objects are returned in request order.
+        """
+        params = self.session._async_client_params(self.ctx.client_params)
+        semaphore = asyncio.Semaphore(max_conns)
+
+        async with httpx.AsyncClient(**params) as client:
+
+            async def create_one(payload: dict[str, Any]) -> SchemaType:
+                async with semaphore:
+                    response = await client.post(
+                        f"{self.base_url}/{namespace}", json=payload
+                    )
+                response.raise_for_status()
+                return self.schema(**response.json())
+
+            return await asyncio.gather(*(create_one(p) for p in payloads))
+
     def __getitem__(self, path: str) -> Optional[SchemaType]:
         if path.startswith("/"):
             namespace, path_in_namespace = parse_path(path)
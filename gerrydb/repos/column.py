@@ -1,13 +1,19 @@
 """Repository for columns."""
+import asyncio
 from typing import Any, Optional, Union
 
 import httpx
 import numpy as np
 
+from gerrydb.exceptions import RequestError
 from gerrydb.repos.base import (
+    NAMESPACE_ERR,
     NamespacedObjectRepo,
+    check_required_fields,
+    check_unknown_fields,
     err,
     namespaced,
+    normalize_path,
     online,
     write_context,
 )
@@ -17,7 +23,6 @@ from gerrydb.schemas import (
     ColumnKind,
     ColumnPatch,
     ColumnType,
-    ColumnValue,
     Geography,
 )
 
@@ -79,6 +84,84 @@ class ColumnRepo(NamespacedObjectRepo[Column]):
 
         return self.schema(**response.json())
 
+    @err("Failed to create columns")
+    @write_context
+    @online
+    def create_bulk(
+        self,
+        columns: list[dict[str, Any]],
+        namespace: Optional[str] = None,
+        max_conns: int = 4,
+    ) -> list[Column]:
+        """Creates tabular data columns concurrently.
+
+        Args:
+            columns: Column definitions, each a mapping of keyword arguments
+                to `create()` (`path`, `column_kind`, `column_type`, etc.).
+            namespace: Namespace to create the columns in.
+            max_conns: Maximum number of simultaneous API connections.
+
+        Raises:
+            RequestError: If a column cannot be created on the server side,
+                if the parameters fail validation (including missing or unknown
+                fields in a column definition), or if no namespace is provided.
+
+        Returns:
+            Metadata for the new columns (in the order of `columns`).
+        """
+        namespace = self.session.namespace if namespace is None else namespace
+        if namespace is None:
+            raise RequestError(NAMESPACE_ERR)
+
+        required_fields = ["path", "column_kind", "column_type", "description"]
+        check_required_fields(columns, required_fields, "column")
+        check_unknown_fields(
+            columns, required_fields + ["source_url", "aliases"], "column"
+        )
+        payloads = [
+            ColumnCreate(
+                canonical_path=col["path"],
+                namespace=namespace,
+                description=col["description"],
+                kind=col["column_kind"],
+                type=col["column_type"],
+                source_url=col.get("source_url"),
+                aliases=col.get("aliases"),
+            ).dict()
+            for col in columns
+        ]
+        return asyncio.run(self._async_create_many(payloads, namespace, max_conns))
+
+    @err("Failed to load columns")
+    def get_many(
+        self, paths: list[str], namespace: Optional[str] = None
+    ) -> dict[str, Column]:
+        """Gets several columns in a namespace with a single request.
+
+        Args:
+            paths: Short identifiers (canonical paths or aliases) of the columns.
+            namespace: Namespace to load the columns from.
+
+        Raises:
+            RequestError: If the columns cannot be read on the server side,
+                if no namespace is specified, or if any of `paths` does not
+                refer to a column in the namespace.
+
+        Returns:
+            A mapping from each of `paths` to its column.
+        """
+        columns_by_path = {}
+        for col in self.all(namespace=namespace):
+            for path in (col.path, *col.aliases):
+                columns_by_path[normalize_path(path)] = col
+
+        missing = [
+            path for path in paths if normalize_path(path) not in columns_by_path
+        ]
+        if missing:
+            raise RequestError(f"Columns not found: {', '.join(missing)}")
+        return {path: columns_by_path[normalize_path(path)] for path in paths}
+
     @err("Failed to update column")
     @namespaced
     @write_context
@@ -136,17 +219,7 @@ class ColumnRepo(NamespacedObjectRepo[Column]):
 
         response = self.ctx.client.put(
             f"{self.base_url}/{namespace}/{path}",
-            json=[
-                ColumnValue(
-                    path=(
-                        f"/{geo.namespace}/{geo.path}"
-                        if isinstance(geo, Geography)
-                        else geo
-                    ),
-                    value=value,
-                ).dict()
-                for geo, value in values.items()
-            ],
+            json=_serialize_values(values),
         )
         response.raise_for_status()
 
@@ -182,23 +255,12 @@ class ColumnRepo(NamespacedObjectRepo[Column]):
 
         ephemeral_client = client is None
         if ephemeral_client:
-            params = self.ctx.client_params.copy()
-            params["transport"] = httpx.AsyncHTTPTransport(retries=1)
+            params = self.session._async_client_params(self.ctx.client_params)
             client = httpx.AsyncClient(**params)
 
         response = await client.put(
             f"{self.base_url}/{namespace}/{path}",
-            json=[
-                ColumnValue(
-                    path=(
-                        f"/{geo.namespace}/{geo.path}"
-                        if isinstance(geo, Geography)
-                        else geo
-                    ),
-                    value=_coerce(value),
-                ).dict()
-                for geo, value in values.items()
-            ],
+            json=_serialize_values(values),
         )
         response.raise_for_status()
 
@@ -208,6 +270,25 @@ class ColumnRepo(NamespacedObjectRepo[Column]):
         # TODO: what's the proper caching behavior here?
 
 
+def _serialize_values(values: dict[Union[str, Geography], Any]) -> list[dict]:
+    """Serializes column values into `ColumnValue`-shaped dictionaries.
+
+    `ColumnValue` has no validation beyond string coercion of paths, so
+    payloads are built directly rather than through a model per value.
+    """
+    return [
+        {
+            "path": (
+                f"/{geo.namespace}/{geo.path}"
+                if isinstance(geo, Geography)
+                else str(geo)
+            ),
+            "value": _coerce(value),
+        }
+        for geo, value in values.items()
+    ]
+
+
 def _coerce(val: Any) -> Any:
     """Coerces values for JSON serialization."""
     if isinstance(val, np.int64):
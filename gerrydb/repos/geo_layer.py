@@ -1,8 +1,13 @@
 """Repository for geographic layers."""
-from typing import Optional, Union
+import asyncio
+from typing import Any, Optional, Union
 
+from gerrydb.exceptions import RequestError
 from gerrydb.repos.base import (
+    NAMESPACE_ERR,
     NamespacedObjectRepo,
+    check_required_fields,
+    check_unknown_fields,
     err,
     namespaced,
     online,
@@ -51,6 +56,49 @@ class GeoLayerRepo(NamespacedObjectRepo[GeoLayer]):
 
         return self.schema(**response.json())
 
+    @err("Failed to create geographic layers")
+    @write_context
+    @online
+    def create_bulk(
+        self,
+        layers: list[dict[str, Any]],
+        namespace: Optional[str] = None,
+        max_conns: int = 4,
+    ) -> list[GeoLayer]:
+        """Creates geographic layers concurrently.
+
+        Args:
+            layers: Layer definitions, each a mapping of keyword arguments
+                to `create()` (`path`, `description`, and `source_url`).
+            namespace: Namespace to create the layers in.
+            max_conns: Maximum number of simultaneous API connections.
+
+        Raises:
+            RequestError: If a layer cannot be created on the server side,
+                if the parameters fail validation (including missing or unknown
+                fields in a layer definition), or if no namespace is provided.
+
+        Returns:
+            The new geographic layers (in the order of `layers`).
+        """
+        namespace = self.session.namespace if namespace is None else namespace
+        if namespace is None:
+            raise RequestError(NAMESPACE_ERR)
+
+        check_required_fields(layers, ["path"], "geographic layer")
+        check_unknown_fields(
+            layers, ["path", "description", "source_url"], "geographic layer"
+        )
+        payloads = [
+            GeoLayerCreate(
+                path=layer["path"],
+                description=layer.get("description"),
+                source_url=layer.get("source_url"),
+            ).dict()
+            for layer in layers
+        ]
+        return asyncio.run(self._async_create_many(payloads, namespace, max_conns))
+
     @err("Failed to map locality to geographic layer")
     @write_context
     @online
@@ -4,7 +4,8 @@ from typing import TYPE_CHECKING, Any, Optional, Tuple, Union
 
 import httpx
 import msgpack
-import shapely.wkb
+import numpy as np
+import shapely
 from shapely import Point
 from shapely.geometry.base import BaseGeometry
 
@@ -38,34 +39,33 @@ def _importer_params(ctx: "WriteContext", namespace: str) -> dict[str, Any]:
 
 def _serialize_geos(geographies: GeosType) -> list[GeographyCreate]:
     """Serializes geographies into raw bytes."""
-    serialized = []
-    for key, geo_pair in geographies.items():
+    paths = []
+    geos = np.empty(len(geographies), dtype=object)
+    points = np.empty(len(geographies), dtype=object)
+    for idx, (key, geo_pair) in enumerate(geographies.items()):
+        paths.append(key.full_path if isinstance(key, Geography) else key)
         if isinstance(geo_pair, tuple):
-            geo, point = geo_pair
+            geos[idx], points[idx] = geo_pair
         elif isinstance(geo_pair, BaseGeometry):
-            geo = geo_pair
-            point = None
-        else:
-            geo = point = None
-
-        serialized.append(
-            GeographyCreate(
-                path=key.full_path if isinstance(key, Geography) else key,
-                geography=None if geo is None else shapely.wkb.dumps(geo),
-                internal_point=None if point is None else shapely.wkb.dumps(point),
-            ).dict()
-        )
+            geos[idx] = geo_pair
 
-    return serialized
+    # Encode all geometries in a single vectorized GEOS call per column
+    # (missing geometries are encoded as `None`).
+    geos_wkb = shapely.to_wkb(geos)
+    points_wkb = shapely.to_wkb(points)
+    return [
+        GeographyCreate(path=path, geography=geo_wkb, internal_point=point_wkb).dict()
+        for path, geo_wkb, point_wkb in zip(paths, geos_wkb, points_wkb)
+    ]
 
 
 def _parse_geo_response(response: httpx.Response) -> list[Geography]:
     """Parses `Geography` objects from a MessagePack-encoded API response."""
-    response_geos = []
-    for response_geo in msgpack.loads(response.content):
-        response_geo["geography"] = shapely.wkb.loads(response_geo["geography"])
-        response_geos.append(Geography(**response_geo))
-    return response_geos
+    response_geos = msgpack.loads(response.content)
+    parsed_geos = shapely.from_wkb([geo["geography"] for geo in response_geos])
+    for response_geo, parsed_geo in zip(response_geos, parsed_geos):
+        response_geo["geography"] = parsed_geo
+    return [Geography(**response_geo) for response_geo in response_geos]
 
 
 @dataclass
@@ -82,7 +82,10 @@ class GeoImporter:
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self.client.close()
+        # Like the write context's client (see `WriteContext.__exit__()`), the
+        # importer's client owns no resources beyond the session's shared
+        # transport, so it is dropped without closing it.
+        pass
 
     @err("Failed to create geographies")
     def create(self, geographies: dict[str, GeoValType]) -> list[Geography]:
@@ -139,8 +142,9 @@ class AsyncGeoImporter:
 
     async def __aenter__(self) -> "AsyncGeoImporter":
         """Creates a context for asynchronously importing geographies in bulk."""
-        params = _importer_params(self.repo.ctx, self.namespace)
-        params["transport"] = httpx.AsyncHTTPTransport(retries=1)
+        params = self.repo.session._async_client_params(
+            _importer_params(self.repo.ctx, self.namespace)
+        )
         self.client = httpx.AsyncClient(**params)
         return self
 
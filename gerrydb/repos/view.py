@@ -3,11 +3,11 @@ import json
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Generator, Optional, Union
+from typing import TYPE_CHECKING, Callable, Generator, Optional, Union
 
-import geopandas as gpd
 import networkx as nx
 import pandas as pd
+import shapely
 import shapely.wkb
 from shapely.geometry.base import BaseGeometry
 
@@ -22,6 +22,8 @@ from gerrydb.repos.base import (
 from gerrydb.schemas import (
     Column,
     ColumnKind,
+    ColumnSet,
+    ColumnType,
     Geography,
     GeoLayer,
     Graph,
@@ -61,9 +63,12 @@ try:
 except ImportError:
     gerrychain = None
 
+if TYPE_CHECKING:
+    import geopandas as gpd
 
-def _load_gpkg_geometry(geom: bytes) -> BaseGeometry:
-    """Loads a geometry from a raw GeoPackage WKB blob."""
+
+def _gpkg_wkb(geom: bytes) -> bytes:
+    """Strips the header from a raw GeoPackage WKB blob."""
     # header format: https://www.geopackage.org/spec/#gpb_format
     envelope_flag = (geom[3] & 0b00001110) >> 1
     try:
@@ -72,7 +77,23 @@ def _load_gpkg_geometry(geom: bytes) -> BaseGeometry:
         raise ValueError("Invalid GeoPackage geometry: bad envelope flag.")
 
     wkb_offset = envelope_bytes + 8
-    return shapely.wkb.loads(geom[wkb_offset:])
+    return geom[wkb_offset:]
+
+
+def _load_gpkg_geometry(geom: bytes) -> BaseGeometry:
+    """Loads a geometry from a raw GeoPackage WKB blob."""
+    return shapely.wkb.loads(_gpkg_wkb(geom))
+
+
+def _load_gpkg_geometries(
+    geoms: list[Optional[bytes]],
+) -> list[Optional[BaseGeometry]]:
+    """Loads geometries from raw GeoPackage WKB blobs in one vectorized call.
+
+    Missing (`None`) blobs are loaded as `None`.
+    """
+    wkbs = [None if geom is None else _gpkg_wkb(geom) for geom in geoms]
+    return list(shapely.from_wkb(wkbs))
 
 
 class View:
@@ -132,8 +153,10 @@ class View:
 
     def to_df(
         self, plans: bool = False, internal_points: bool = False
-    ) -> gpd.GeoDataFrame:
+    ) -> "gpd.GeoDataFrame":
         """Loads the view as a GeoDataFrame."""
+        import geopandas as gpd  # deferred: slow to import, only needed here
+
         gdf = gpd.read_file(self._gpkg_path, layer=self.path).set_index("path")
 
         if plans:
@@ -166,6 +189,51 @@ class View:
             # No plans table.
             return []
 
+    def tally(self, plan: str, column: str) -> dict[str, Union[int, float]]:
+        """Sums a column over the districts of a plan in the view.
+
+        The aggregation runs directly against the GeoPackage, so no graph
+        or `Partition` is constructed. Geographies not assigned to a district
+        are excluded.
+
+        Args:
+            plan: Path of a plan in the view.
+            column: Path of a numeric (`int` or `float`) column in the view.
+
+        Raises:
+            KeyError: If `plan` or `column` is not in the view.
+            ValueError: If `column` is not numeric.
+
+        Returns:
+            A mapping from district labels to column sums.
+        """
+        if plan == "path" or plan not in self._plan_cols():
+            raise KeyError(f'Plan "{plan}" not found in view.')
+
+        template_cols = {}
+        for member in self.template.members:
+            for col in member.columns if isinstance(member, ColumnSet) else [member]:
+                template_cols[col.path] = col
+        raw_cols = self._conn.execute(
+            "SELECT name from pragma_table_info(?)",
+            (self.path,),
+        ).fetchall()
+        if column not in template_cols or column not in {row[0] for row in raw_cols}:
+            raise KeyError(f'Column "{column}" not found in view.')
+        if template_cols[column].type not in (ColumnType.INT, ColumnType.FLOAT):
+            raise ValueError(
+                f'Cannot tally column "{column}" of type '
+                f"{template_cols[column].type.value} (must be int or float)."
+            )
+
+        rows = self._conn.execute(
+            f'SELECT gerrydb_plan_assignment."{plan}", SUM({self.path}."{column}") '
+            f"FROM {self.path} JOIN gerrydb_plan_assignment "
+            f"ON {self.path}.path = gerrydb_plan_assignment.path "
+            f'GROUP BY gerrydb_plan_assignment."{plan}"'
+        )
+        return {district: total for district, total in rows if district is not None}
+
     def to_graph(self, plans: bool = True, geometry: bool = False) -> nx.Graph:
         """Loads the view as a NetworkX graph."""
         raw_cols = self._conn.execute(
@@ -211,24 +279,19 @@ class View:
         query += " ".join(join_clauses)
 
         # Load nodes with selected attributes.
-        graph = nx.Graph()
-        for row in self._conn.execute(query):
-            node_attrs = dict(zip(columns, row))
-            path = node_attrs["path"]
-            del node_attrs["path"]
-            if geometry:
-                node_attrs["geometry"] = (
-                    None
-                    if node_attrs["geography"] is None
-                    else _load_gpkg_geometry(node_attrs["geography"])
-                )
+        nodes = [dict(zip(columns, row)) for row in self._conn.execute(query)]
+        if geometry:
+            geoms = _load_gpkg_geometries([node["geography"] for node in nodes])
+            points = _load_gpkg_geometries([node["internal_point"] for node in nodes])
+            for node_attrs, geom, point in zip(nodes, geoms, points):
                 del node_attrs["geography"]
-                node_attrs["internal_point"] = (
-                    None
-                    if node_attrs["internal_point"] is None
-                    else _load_gpkg_geometry(node_attrs["internal_point"])
-                )
-            graph.add_node(path, **node_attrs)
+                node_attrs["geometry"] = geom
+                node_attrs["internal_point"] = point
+
+        graph = nx.Graph()
+        graph.add_nodes_from(
+            (node_attrs.pop("path"), node_attrs) for node_attrs in nodes
+        )
 
         # Load edges with weights (attributes).
         raw_edges = self._conn.execute(
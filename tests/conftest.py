@@ -1,21 +1,74 @@
 """Fixtures for API tests."""
+import asyncio
 import json
 import os
 from pathlib import Path
 
-import geopandas as gpd
+import httpx
 import pytest
 from networkx.readwrite import json_graph
 
 from gerrydb import GerryDB
+from gerrydb.repos.base import HTTP2
+
+
+@pytest.fixture(scope="session")
+def http_transport():
+    """An HTTP transport whose connection pool is shared across test sessions."""
+    transport = httpx.HTTPTransport(
+        retries=1,
+        http2=HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+    )
+    yield transport
+    transport.close()
+
+
+@pytest.fixture(scope="session")
+def http_async_transport():
+    """An async HTTP transport (for bulk operations) shared across test sessions."""
+    transport = httpx.AsyncHTTPTransport(
+        retries=1,
+        http2=HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+    )
+    yield transport
+    asyncio.run(transport.aclose())
+
+
+@pytest.fixture
+def mock_meta_handler():
+    """A mock API request handler that only creates write contexts.
+
+    `POST /meta/` returns object metadata; any other request fails with
+    HTTP 500. Use with `httpx.MockTransport` to test client-side behavior
+    without a GerryDB server.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST" and request.url.path.endswith("/meta/"):
+            return httpx.Response(
+                200,
+                json={
+                    "uuid": "00000000-0000-0000-0000-000000000000",
+                    "created_at": "2023-01-01T00:00:00",
+                    "created_by": "test@example.com",
+                    "notes": None,
+                },
+            )
+        return httpx.Response(500, json={"detail": "Not supported by mock API."})
+
+    return handler
 
 
 @pytest.fixture
-def client():
+def client(http_transport, http_async_transport):
     # Requires a running GerryDB server.
     return GerryDB(
         host=os.environ.get("GERRYDB_TEST_SERVER", "localhost:8000"),
         key=os.environ.get("GERRYDB_TEST_API_KEY"),
+        transport=http_transport,
+        async_transport=http_async_transport,
     )
 
 
@@ -46,6 +99,8 @@ def vcr_config():
 @pytest.fixture(scope="session")
 def ia_dataframe():
     """`GeoDataFrame` of Iowa counties."""
+    import geopandas as gpd
+
     shp_path = Path(__file__).resolve().parent / "fixtures" / "tl_2020_19_county20.zip"
     return gpd.read_file(shp_path).set_index("GEOID20")
 
@@ -84,28 +139,31 @@ def ia_column_meta():
 
 
 @pytest.fixture(scope="session")
-def client_with_ia_layer_loc(ia_dataframe, ia_column_meta):
+def client_with_ia_layer_loc(
+    http_transport, http_async_transport, ia_dataframe, ia_column_meta
+):
     """A namespaced client with a `GeoLayer` and `Locality` for Iowa counties."""
     client = GerryDB(
         host=os.environ.get("GERRYDB_TEST_SERVER", "localhost:8000"),
         key=os.environ.get("GERRYDB_TEST_API_KEY"),
+        transport=http_transport,
+        async_transport=http_async_transport,
     )
 
+    client.namespace = "plan"
+
     with client.context(
-        notes=f"Test setup for gerrydb-client-py plan repository tests",
+        notes="Test setup for gerrydb-client-py plan repository tests: "
+        "importing Iowa counties shapefile",
     ) as ctx:
         ctx.namespaces.create(
             path="plan",
             description="gerrydb-client-py plan repository tests",
             public=True,
         )
-
-    client.namespace = "plan"
-
-    with client.context(notes="Importing Iowa counties shapefile") as ctx:
-        columns = {
-            name: ctx.columns.create(**meta) for name, meta in ia_column_meta.items()
-        }
+        columns = dict(
+            zip(ia_column_meta, ctx.columns.create_bulk(list(ia_column_meta.values())))
+        )
         layer = ctx.geo_layers.create(
             path="counties",
             description="2020 U.S. Census counties.",
@@ -1,6 +1,9 @@
 """Fixtures for repository tests."""
+import httpx
 import pytest
 
+from gerrydb import GerryDB
+
 
 @pytest.fixture
 def pop_column_meta():
@@ -26,3 +29,19 @@ def vap_column_meta():
         "column_type": "float",
         "aliases": ["totvap", "p003001", "p0003001"],
     }
+
+
+@pytest.fixture
+def client_mock_meta(mock_meta_handler):
+    """A namespaced client backed by a mock API that only creates write contexts.
+
+    Useful for testing client-side validation: any other request (synchronous
+    or asynchronous) fails without leaving the mock API.
+    """
+    return GerryDB(
+        host="example.com",
+        key="key",
+        namespace="test",
+        transport=httpx.MockTransport(mock_meta_handler),
+        async_transport=httpx.MockTransport(mock_meta_handler),
+    )
@@ -1,7 +1,10 @@
 """Integration/VCR tests for columns."""
+import numpy as np
 import pytest
 from shapely import box
 
+from gerrydb.exceptions import RequestError, ResultError
+from gerrydb.repos.column import _serialize_values
 from gerrydb.schemas import ColumnKind, ColumnType
 
 
@@ -31,6 +34,51 @@ def test_column_repo_create_all(client_ns, column):
     assert "total_pop" in [col.path for col in client_ns.columns.all()]
 
 
+@pytest.mark.vcr
+def test_column_repo_create_bulk(client_ns, pop_column_meta, vap_column_meta):
+    with client_ns.context(notes="adding columns in bulk") as ctx:
+        pop_col, vap_col = ctx.columns.create_bulk([pop_column_meta, vap_column_meta])
+
+    assert pop_col.path == "total_pop"
+    assert vap_col.path == "total_vap"
+    assert vap_col.type == ColumnType.FLOAT
+    assert client_ns.columns["total_vap"] == vap_col
+
+
+@pytest.mark.vcr
+def test_column_repo_create_bulk_get_many(client_ns, pop_column_meta, vap_column_meta):
+    with client_ns.context(notes="adding columns in bulk") as ctx:
+        pop_col, vap_col = ctx.columns.create_bulk([pop_column_meta, vap_column_meta])
+
+    assert client_ns.columns.get_many(["total_vap", "totpop"]) == {
+        "total_vap": vap_col,
+        "totpop": pop_col,
+    }
+    with pytest.raises(RequestError, match="not found: missing"):
+        client_ns.columns.get_many(["total_pop", "missing"])
+
+
+def test_column_repo_create_bulk__missing_key(client_mock_meta, pop_column_meta):
+    spec = {k: v for k, v in pop_column_meta.items() if k != "description"}
+    with client_mock_meta.context(notes="adding columns in bulk") as ctx:
+        with pytest.raises(RequestError, match="index 1 .*total_pop.*description"):
+            ctx.columns.create_bulk([pop_column_meta, spec])
+
+
+def test_column_repo_create_bulk__unknown_key(client_mock_meta, pop_column_meta):
+    spec = {**pop_column_meta, "alias": ["population"]}
+    with client_mock_meta.context(notes="adding columns in bulk") as ctx:
+        with pytest.raises(RequestError, match="index 0 .*total_pop.*unknown.*alias"):
+            ctx.columns.create_bulk([spec])
+
+
+def test_column_repo_create_bulk__mock_api(client_mock_meta, pop_column_meta):
+    # Valid specs are sent to the (failing) mock API, not a live server.
+    with client_mock_meta.context(notes="adding columns in bulk") as ctx:
+        with pytest.raises(ResultError, match="HTTP request failed"):
+            ctx.columns.create_bulk([pop_column_meta])
+
+
 @pytest.mark.vcr
 def test_column_repo_create_update_get(client_ns, column):
     with client_ns.context(notes="adding and then updating a column") as ctx:
@@ -47,3 +95,14 @@ def test_column_repo_set_values(client_ns, column):
         with ctx.geo.bulk() as geo_ctx:
             geo_ctx.create({str(idx): box(0, 0, 1, 1) for idx in range(n)})
         ctx.columns.set_values(col, values={str(idx): idx for idx in range(n)})
+
+
+def test_serialize_values():
+    assert _serialize_values(
+        {"a": np.int64(1), 19001: np.float64(2.5), "c": "x", "d": None}
+    ) == [
+        {"path": "a", "value": 1},
+        {"path": "19001", "value": 2.5},
+        {"path": "c", "value": "x"},
+        {"path": "d", "value": None},
+    ]
@@ -1,6 +1,8 @@
 """Integration/VCR tests for geographic layers."""
 import pytest
 
+from gerrydb.exceptions import RequestError
+
 
 @pytest.mark.vcr
 def test_geo_layer_repo_create_get(client_ns):
@@ -22,3 +24,30 @@ def test_geo_layer_repo_create_all(client_ns):
         ctx.geo_layers.create("blocks/2020", description="2020 Census blocks")
 
     assert "blocks/2020" in [layer.path for layer in client_ns.geo_layers.all()]
+
+
+@pytest.mark.vcr
+def test_geo_layer_repo_create_bulk(client_ns):
+    with client_ns.context(notes="adding geographic layers in bulk") as ctx:
+        layers = ctx.geo_layers.create_bulk(
+            [
+                {"path": "counties/2020", "description": "2020 Census counties"},
+                {"path": "tracts/2020", "description": "2020 Census tracts"},
+            ]
+        )
+
+    assert [layer.path for layer in layers] == ["counties/2020", "tracts/2020"]
+    assert client_ns.geo_layers["tracts/2020"] == layers[1]
+
+
+def test_geo_layer_repo_create_bulk__missing_key(client_mock_meta):
+    with client_mock_meta.context(notes="adding geographic layers in bulk") as ctx:
+        with pytest.raises(RequestError, match="index 0 .*missing.*path"):
+            ctx.geo_layers.create_bulk([{"description": "2020 Census tracts"}])
+
+
+def test_geo_layer_repo_create_bulk__unknown_key(client_mock_meta):
+    spec = {"path": "tracts", "desc": "2020 Census tracts"}
+    with client_mock_meta.context(notes="adding geographic layers in bulk") as ctx:
+        with pytest.raises(RequestError, match="index 0 .*tracts.*unknown.*desc"):
+            ctx.geo_layers.create_bulk([spec])
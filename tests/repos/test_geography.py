@@ -1,8 +1,33 @@
 """Integration/VCR tests for columns."""
-from shapely import box
+import shapely.wkb
+from shapely import Point, box
+
+from gerrydb.repos.geography import _serialize_geos
 
 
 def test_geography_repo_create(client_ns):
     with client_ns.context(notes="adding a geography") as ctx:
         with ctx.geo.bulk() as bulk_ctx:
             geos = bulk_ctx.create({str(idx): box(0, 0, 1, 1) for idx in range(10000)})
+
+
+def test_serialize_geos():
+    geo = box(0, 0, 1, 1)
+    point = Point(0.5, 0.5)
+    serialized = _serialize_geos(
+        {"a": geo, "b": None, "c": (geo, point), "d": (None, point)}
+    )
+
+    assert [row["path"] for row in serialized] == ["a", "b", "c", "d"]
+    assert [row["geography"] for row in serialized] == [
+        shapely.wkb.dumps(geo),
+        None,
+        shapely.wkb.dumps(geo),
+        None,
+    ]
+    assert [row["internal_point"] for row in serialized] == [
+        None,
+        None,
+        shapely.wkb.dumps(point),
+        shapely.wkb.dumps(point),
+    ]
@@ -1,6 +1,13 @@
 """Tests for views."""
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
 import pytest
 
+from gerrydb.repos.view import View
+from gerrydb.schemas import Column, ColumnSet, ObjectMeta, ViewMeta, ViewTemplate
+
 
 @pytest.mark.vcr
 def test_view_repo_create__valid(client_with_ia_layer_loc, ia_dataframe):
@@ -99,3 +106,86 @@ def test_view_repo_view_to_graph_geo(ia_view_with_graph, ia_graph):
         "/".join(col.split("/")[2:]) for col in ia_view_with_graph.values
     ) | {"area", "geometry"}
     assert all(set(data) == expected_cols for _, data in view_graph.nodes(data=True))
+
+
+@pytest.fixture
+def tally_view():
+    """A minimal in-memory view with a plan, for unit tests of `View.tally()`."""
+    meta = ObjectMeta(
+        uuid="00000000-0000-0000-0000-000000000000",
+        created_at=datetime(2023, 1, 1),
+        created_by="test@example.com",
+    )
+
+    def column(path, kind, col_type):
+        return Column(
+            canonical_path=path,
+            namespace="tally",
+            description=path,
+            kind=kind,
+            type=col_type,
+            aliases=[],
+            meta=meta,
+        )
+
+    template = ViewTemplate.construct(
+        members=[
+            column("total_pop", "count", "int"),
+            ColumnSet.construct(columns=[column("name", "identifier", "str")]),
+        ]
+    )
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE counties (fid INTEGER, path TEXT, geography BLOB, "
+        "total_pop INTEGER, name TEXT, extra INTEGER)"
+    )
+    conn.executemany(
+        "INSERT INTO counties VALUES (?, ?, NULL, ?, ?, 0)",
+        [(1, "a", 10, "A"), (2, "b", 5, "B"), (3, "c", 7, "C"), (4, "d", 1, "D")],
+    )
+    conn.execute('CREATE TABLE gerrydb_plan_assignment (path TEXT, "test_plan" TEXT)')
+    conn.executemany(
+        "INSERT INTO gerrydb_plan_assignment VALUES (?, ?)",
+        [("a", "1"), ("b", "1"), ("c", "2"), ("d", None)],
+    )
+    yield View(
+        meta=ViewMeta.construct(
+            namespace="tally",
+            path="counties",
+            template=template,
+            locality=None,
+            layer=None,
+            meta=meta,
+            valid_at=datetime(2023, 1, 1),
+            proj=None,
+            graph=None,
+        ),
+        gpkg_path=Path("counties.gpkg"),
+        conn=conn,
+    )
+    conn.close()
+
+
+def test_view_tally(tally_view):
+    # Geography "d" is unassigned, so it is excluded from all districts.
+    assert tally_view.tally("test_plan", "total_pop") == {"1": 15, "2": 7}
+
+
+def test_view_tally__unknown_plan(tally_view):
+    with pytest.raises(KeyError, match="Plan"):
+        tally_view.tally("missing_plan", "total_pop")
+    with pytest.raises(KeyError, match="Plan"):
+        tally_view.tally("path", "total_pop")
+
+
+def test_view_tally__unknown_column(tally_view):
+    with pytest.raises(KeyError, match="Column"):
+        tally_view.tally("test_plan", "missing")
+    # Columns in the GeoPackage but not in the view template are rejected.
+    with pytest.raises(KeyError, match="Column"):
+        tally_view.tally("test_plan", "extra")
+
+
+def test_view_tally__non_numeric_column(tally_view):
+    with pytest.raises(ValueError, match="must be int or float"):
+        tally_view.tally("test_plan", "name")
@@ -1,35 +1,228 @@
 """Tests for GerryDB's local caching layer."""
-import uuid
+import sqlite3
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import pytest
 
-from gerrydb.cache import CacheInitError, CacheObjectError, CachePolicyError, GerryCache
-from gerrydb.schemas import BaseModel, ObjectCachePolicy, ObjectMeta
+from gerrydb.cache import CacheInitError, GerryCache
+
+# Durability is irrelevant for throwaway test caches.
+TEST_PRAGMAS = {"synchronous": "OFF", "temp_store": "MEMORY"}
+
+
+@pytest.fixture(scope="session")
+def cache_conn():
+    """A shared in-memory SQLite connection with an initialized cache schema."""
+    data_dir = TemporaryDirectory()
+    try:
+        cache = GerryCache(
+            ":memory:", data_dir=Path(data_dir.name), pragmas=TEST_PRAGMAS
+        )
+        yield cache._conn
+        cache.close()
+    finally:
+        data_dir.cleanup()
 
 
 @pytest.fixture
-def cache():
-    """An in-memory instance of `GerryCache`."""
-    return GerryCache(":memory:")
+def cache(cache_conn):
+    """An instance of `GerryCache` on the shared connection.
+
+    Each test runs in a savepoint that is rolled back on teardown, so
+    tests must not commit or roll back the cache transaction themselves.
+    """
+    data_dir = TemporaryDirectory()
+    cache_conn.execute("SAVEPOINT test")
+    try:
+        cache = GerryCache(cache_conn, data_dir=Path(data_dir.name))
+        yield cache
+    finally:
+        cache_conn.execute("ROLLBACK TO SAVEPOINT test")
+        cache_conn.execute("RELEASE SAVEPOINT test")
+        data_dir.cleanup()
+
+
+@pytest.fixture
+def fresh_cache():
+    """An isolated in-memory instance of `GerryCache` (for destructive tests)."""
+    data_dir = TemporaryDirectory()
+    try:
+        cache = GerryCache(
+            ":memory:", data_dir=Path(data_dir.name), pragmas=TEST_PRAGMAS
+        )
+        yield cache
+        cache.close()
+    finally:
+        data_dir.cleanup()
+
+
+def test_gerry_cache_init__pragmas(cache):
+    assert cache._conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+    assert cache._conn.execute("PRAGMA temp_store").fetchone()[0] == 2
 
 
-def test_gerry_cache_init__no_schema_version(cache):
-    cache._conn.execute("DELETE FROM cache_meta")
-    cache._conn.commit()
+def test_gerry_cache_init__bad_pragma_name(tmp_path):
+    with pytest.raises(CacheInitError, match="Invalid SQLite pragma name"):
+        GerryCache(
+            ":memory:",
+            data_dir=tmp_path,
+            pragmas={"synchronous = OFF; DROP TABLE cache_meta; --": "OFF"},
+        )
+
+
+def test_gerry_cache_init__no_schema_version(fresh_cache):
+    fresh_cache._conn.execute("DELETE FROM cache_meta")
+    fresh_cache._conn.commit()
     with pytest.raises(CacheInitError, match="no schema version"):
-        GerryCache(cache._conn)
+        GerryCache(fresh_cache._conn, data_dir=fresh_cache.data_dir)
 
 
-def test_gerry_cache_init__bad_schema_version(cache):
-    cache._conn.execute("UPDATE cache_meta SET value='bad' WHERE key='schema_version'")
-    cache._conn.commit()
+def test_gerry_cache_init__bad_schema_version(fresh_cache):
+    fresh_cache._conn.execute(
+        "UPDATE cache_meta SET value='bad' WHERE key='schema_version'"
+    )
+    fresh_cache._conn.commit()
     with pytest.raises(CacheInitError, match="expected schema version"):
-        GerryCache(cache._conn)
+        GerryCache(fresh_cache._conn, data_dir=fresh_cache.data_dir)
+
+
+def test_gerry_cache_init__missing_table(fresh_cache):
+    fresh_cache._conn.execute("DROP TABLE view")
+    fresh_cache._conn.commit()
+    with pytest.raises(CacheInitError, match="missing table"):
+        GerryCache(fresh_cache._conn, data_dir=fresh_cache.data_dir)
+
+
+def test_gerry_cache_init__legacy_schema_version():
+    # A cache as initialized by clients using schema version 0.
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.execute("CREATE TABLE cache_meta(key TEXT PRIMARY KEY, value TEXT)")
+    conn.execute(
+        "CREATE TABLE view(namespace TEXT, path TEXT, render_id TEXT, "
+        "cached_at TEXT, UNIQUE(namespace, path))"
+    )
+    conn.execute(
+        "CREATE TABLE graph(render_id TEXT, plans INTEGER, geometry INTEGER, "
+        "cached_at TEXT, UNIQUE(render_id, plans, geometry))"
+    )
+    conn.execute("INSERT INTO cache_meta VALUES ('schema_version', '0')")
+    conn.execute(
+        "INSERT INTO view VALUES ('atlantis', 'view', 'render0', ?)",
+        (datetime.now().isoformat(),),
+    )
+
+    with TemporaryDirectory() as data_dir:
+        stale_path = Path(data_dir) / "render0.gpkg"
+        stale_path.write_bytes(b"gpkg")
+        cache = GerryCache(conn, data_dir=Path(data_dir))
+
+        assert cache._schema_version() == "1"
+        assert not stale_path.exists()
+        assert cache.get_view_gpkg(namespace="atlantis", path="view") is None
+
+        cache.upsert_view_gpkg(
+            namespace="atlantis", path="view", render_id="render1", content=b"gpkg"
+        )
+        cached_at = conn.execute("SELECT cached_at FROM view").fetchone()[0]
+        assert isinstance(cached_at, int)
+        cache.close()
+
+
+def test_gerry_cache_commit(fresh_cache):
+    fresh_cache._conn.execute("BEGIN")
+    fresh_cache.upsert_view_gpkg(
+        namespace="atlantis", path="view", render_id="render1", content=b"gpkg"
+    )
+    assert fresh_cache._conn.in_transaction
+    fresh_cache._commit()
+    assert not fresh_cache._conn.in_transaction
+    assert fresh_cache._conn.execute("SELECT COUNT(*) FROM view").fetchone()[0] == 1
+
+
+def test_gerry_cache_rollback(fresh_cache):
+    fresh_cache._conn.execute("BEGIN")
+    fresh_cache.upsert_view_gpkg(
+        namespace="atlantis", path="view", render_id="render1", content=b"gpkg"
+    )
+    fresh_cache._rollback()
+    assert not fresh_cache._conn.in_transaction
+    assert fresh_cache.get_view_gpkg(namespace="atlantis", path="view") is None
+
+
+def test_gerry_cache_upsert_get_view_gpkg(cache):
+    gpkg_path = cache.upsert_view_gpkg(
+        namespace="atlantis", path="view", render_id="render1", content=b"gpkg"
+    )
+    assert gpkg_path.read_bytes() == b"gpkg"
+    assert cache.get_view_gpkg(namespace="atlantis", path="view") == gpkg_path
+    assert cache.get_view_gpkg(namespace="atlantis", path="other") is None
+
+
+def test_gerry_cache_get_view_gpkg__after_file_deletion(cache):
+    gpkg_path = cache.upsert_view_gpkg(
+        namespace="atlantis", path="view", render_id="render1", content=b"gpkg"
+    )
+    gpkg_path.unlink()
+    assert cache.get_view_gpkg(namespace="atlantis", path="view") is None
+
+
+def test_gerry_cache_upsert_view_gpkg__replaces_previous(cache):
+    old_path = cache.upsert_view_gpkg(
+        namespace="atlantis", path="view", render_id="render1", content=b"old"
+    )
+    new_path = cache.upsert_view_gpkg(
+        namespace="atlantis", path="view", render_id="render2", content=b"new"
+    )
+
+    assert not old_path.exists()
+    assert new_path.read_bytes() == b"new"
+    assert cache.get_view_gpkg(namespace="atlantis", path="view") == new_path
+    assert cache._conn.execute("SELECT COUNT(*) FROM view").fetchone()[0] == 1
+
+
+def test_gerry_cache_upsert_view_gpkg__same_render(cache):
+    cache.upsert_view_gpkg(
+        namespace="atlantis", path="view", render_id="render1", content=b"gpkg"
+    )
+    gpkg_path = cache.upsert_view_gpkg(
+        namespace="atlantis", path="view", render_id="render1", content=b"gpkg"
+    )
+    assert cache.get_view_gpkg(namespace="atlantis", path="view") == gpkg_path
+
+
+def test_gerry_cache_upsert_view_gpkg__write_failure(cache):
+    cache.data_dir = cache.data_dir / "missing"
+    with pytest.raises(FileNotFoundError):
+        cache.upsert_view_gpkg(
+            namespace="atlantis", path="view", render_id="render1", content=b"gpkg"
+        )
+    assert cache._conn.execute("SELECT COUNT(*) FROM view").fetchone()[0] == 0
+
+
+def test_gerry_cache_upsert_view_gpkg__index_failure(cache):
+    cache._conn.execute(
+        "CREATE TRIGGER fail_insert BEFORE INSERT ON view "
+        "BEGIN SELECT RAISE(ABORT, 'index failure'); END"
+    )
+    with pytest.raises(sqlite3.IntegrityError, match="index failure"):
+        cache.upsert_view_gpkg(
+            namespace="atlantis", path="view", render_id="render1", content=b"gpkg"
+        )
+    assert not (cache.data_dir / "render1.gpkg").exists()
+    assert cache._conn.execute("SELECT COUNT(*) FROM view").fetchone()[0] == 0
+
 
+def test_gerry_cache_upsert_view_gpkg__cached_at(cache):
+    before = datetime.now(timezone.utc)
+    cache.upsert_view_gpkg(
+        namespace="atlantis", path="view", render_id="render1", content=b"gpkg"
+    )
+    cached_at = cache._conn.execute("SELECT cached_at FROM view").fetchone()[0]
 
-def test_gerry_cache_init__missing_table(cache):
-    cache._conn.execute("DROP TABLE object")
-    cache._conn.commit()
-    with pytest.raises(CacheInitError, match="missing tables"):
-        GerryCache(cache._conn)
+    assert isinstance(cached_at, int)
+    cached_at_dt = datetime.fromtimestamp(cached_at / 1000, tz=timezone.utc)
+    assert (
+        before - timedelta(seconds=1) <= cached_at_dt <= before + timedelta(minutes=1)
+    )
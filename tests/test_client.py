@@ -1,19 +1,44 @@
 """Tests for GerryDB session management."""
 import os
+import re
 from unittest import mock
 
+import httpx
 import pytest
 
 from gerrydb.client import ConfigError, GerryDB
 
+NO_API_KEY_RE = re.compile("No API key")
+NO_HOST_RE = re.compile("No host")
+FAILED_TO_READ_RE = re.compile("Failed to read")
+FAILED_TO_PARSE_RE = re.compile("Failed to parse")
+PROFILE_RE = re.compile("Profile")
+MISSING_FIELD_RES = {field: re.compile(f'Field "{field}"') for field in ("host", "key")}
+
+
+@pytest.fixture(scope="module")
+def gerrydb_root_dir(tmp_path_factory):
+    """A configuration directory shared by the module's tests.
+
+    Tests that use the directory overwrite the config file before reading it.
+    """
+    return tmp_path_factory.mktemp("gerrydb_root")
+
+
+@pytest.fixture
+def gerrydb_root(gerrydb_root_dir, monkeypatch):
+    """The shared configuration directory, set as `GERRYDB_ROOT` for one test."""
+    monkeypatch.setenv("GERRYDB_ROOT", str(gerrydb_root_dir))
+    return gerrydb_root_dir
+
 
 def test_gerrydb_init_no_api_key():
-    with pytest.raises(ConfigError, match="No API key"):
+    with pytest.raises(ConfigError, match=NO_API_KEY_RE):
         GerryDB(host="example.com")
 
 
 def test_gerrydb_init_no_host():
-    with pytest.raises(ConfigError, match="No host"):
+    with pytest.raises(ConfigError, match=NO_HOST_RE):
         GerryDB(key="key")
 
 
@@ -23,52 +48,72 @@ def test_gerrydb_init_host_key():
 
 def test_gerrydb_init_missing_config(tmp_path):
     with mock.patch.dict(os.environ, {"GERRYDB_ROOT": str(tmp_path)}):
-        with pytest.raises(ConfigError, match="Failed to read"):
+        with pytest.raises(ConfigError, match=FAILED_TO_READ_RE):
             GerryDB()
 
 
-def test_gerrydb_init_invalid_config(tmp_path):
-    with mock.patch.dict(os.environ, {"GERRYDB_ROOT": str(tmp_path)}):
-        with open(tmp_path / "config", "w") as config_fp:
-            config_fp.write("bad")
-        with pytest.raises(ConfigError, match="Failed to parse"):
-            GerryDB()
+def test_gerrydb_init_invalid_config(gerrydb_root):
+    (gerrydb_root / "config").write_text("bad")
+    with pytest.raises(ConfigError, match=FAILED_TO_PARSE_RE):
+        GerryDB()
 
 
-def test_gerrydb_init_missing_profile(tmp_path):
-    with mock.patch.dict(os.environ, {"GERRYDB_ROOT": str(tmp_path)}):
-        open(tmp_path / "config", "w").close()
-        with pytest.raises(ConfigError, match="Profile"):
-            GerryDB()
+def test_gerrydb_init_missing_profile():
+    with pytest.raises(ConfigError, match=PROFILE_RE):
+        GerryDB(config={})
 
 
 @pytest.mark.parametrize("field", ["host", "key"])
-def test_gerrydb_init_missing_field(tmp_path, field):
-    with mock.patch.dict(os.environ, {"GERRYDB_ROOT": str(tmp_path)}):
-        other_field = "host" if field == "key" else "key"
-        with open(tmp_path / "config", "w") as config_fp:
-            print("[default]", file=config_fp)
-            print(f'{other_field} = "test"', file=config_fp)
-        with pytest.raises(ConfigError, match=f'Field "{field}"'):
-            GerryDB()
+def test_gerrydb_init_missing_field(field):
+    other_field = "host" if field == "key" else "key"
+    with pytest.raises(ConfigError, match=MISSING_FIELD_RES[field]):
+        GerryDB(config={"default": {other_field: "test"}})
 
 
-def test_gerrydb_init_default_profile(tmp_path):
-    with mock.patch.dict(os.environ, {"GERRYDB_ROOT": str(tmp_path)}):
-        with open(tmp_path / "config", "w") as config_fp:
-            print("[default]", file=config_fp)
-            print('host = "example.com"', file=config_fp)
-            print('key = "test"', file=config_fp)
-        assert GerryDB().cache is not None
+def test_gerrydb_init_default_profile(gerrydb_root):
+    (gerrydb_root / "config").write_text(
+        '[default]\nhost = "example.com"\nkey = "test"\n'
+    )
+    assert GerryDB().cache is not None
 
 
-def test_gerrydb_init_alt_profile(tmp_path):
-    with mock.patch.dict(os.environ, {"GERRYDB_ROOT": str(tmp_path)}):
-        with open(tmp_path / "config", "w") as config_fp:
-            print("[alt]", file=config_fp)
-            print('host = "example.com"', file=config_fp)
-            print('key = "test"', file=config_fp)
-        assert GerryDB(profile="alt").cache is not None
+def test_gerrydb_init_alt_profile(gerrydb_root):
+    config = {"alt": {"host": "example.com", "key": "test"}}
+    assert GerryDB(profile="alt", config=config).cache is not None
+
+
+def test_gerrydb_init_shared_transport():
+    transport = httpx.HTTPTransport()
+    db = GerryDB(key="key", host="example.com", transport=transport)
+    assert db._transport is transport
+    assert db.client._transport is transport
+
+
+def test_gerrydb_init_shared_async_transport():
+    async_transport = httpx.AsyncHTTPTransport()
+    db = GerryDB(key="key", host="example.com", async_transport=async_transport)
+    assert db._async_client_params({})["transport"] is async_transport
+
+
+def test_gerrydb_context_exit__shared_transport_left_open(
+    monkeypatch, mock_meta_handler
+):
+    # Environment proxies are ignored by clients with an explicit transport.
+    monkeypatch.setenv("HTTPS_PROXY", "http://localhost:3128")
+    closed = []
+
+    class RecordingTransport(httpx.MockTransport):
+        def close(self):
+            closed.append(self)
+
+    transport = RecordingTransport(mock_meta_handler)
+    db = GerryDB(key="key", host="example.com", transport=transport)
+    for notes in ("first context", "second context"):
+        with db.context(notes=notes) as ctx:
+            # The context's client owns nothing beyond the shared transport.
+            assert ctx.client._transport is transport
+            assert not ctx.client._mounts
+    assert closed == []
 
 
 def test_gerrydb_base_url():
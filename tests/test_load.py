@@ -3,9 +3,9 @@
 
 def test_load_dataframe__with_geo__ia_counties(client_ns, ia_dataframe, ia_column_meta):
     with client_ns.context(notes="Importing Iowa counties shapefile") as ctx:
-        columns = {
-            name: ctx.columns.create(**meta) for name, meta in ia_column_meta.items()
-        }
+        columns = dict(
+            zip(ia_column_meta, ctx.columns.create_bulk(list(ia_column_meta.values())))
+        )
         layer = ctx.geo_layers.create(
             path="counties",
             description="2020 U.S. Census counties.",